@@ -1,5 +1,5 @@
-from node import Node
-from block import Block
-from transaction import Transaction
-from constants import *
-from custom_typing import *
+from src.node import Node
+from src.block import Block
+from src.transaction import Transaction
+from src.constants import *
+from src.custom_typing import *
@@ -1,39 +1,60 @@
-from cryptographic_utils import crypto_hash
-from custom_typing import BlockHash
-from transaction import Transaction
+from dataclasses import dataclass, field
+from typing import Optional
 
+from src.cryptographic_utils import crypto_hash_parts
+from src.custom_typing import BlockHash
+from src.transaction import Transaction
 
+
+@dataclass(frozen=True, slots=True)
 class Block:
     """
     this class represents a single block in the blockchain
+    blocks are immutable, their content is fixed at construction time
     """
+    # the hash of the block this block extends
+    prev_block_hash: BlockHash
+    # the transactions attached to this block
+    transactions: tuple[Transaction, ...]
+    # lazily computed and memoized hash of this block
+    _hash: Optional[BlockHash] = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
-    def __init__(
-            self,
-            prev_block_hash: BlockHash,
-            transactions: list[Transaction],
-    ) -> None:
-        self.prev_block_hash: BlockHash = prev_block_hash
-        self.transactions: list[Transaction] = transactions
+    def __post_init__(self) -> None:
+        # allow callers to pass any iterable of transactions while the
+        # stored form stays an immutable tuple
+        object.__setattr__(self, 'transactions', tuple(self.transactions))
 
     def get_hash(self) -> BlockHash:
         """
         calculates and returns the hash of this block
         the hash depends on the contents of the block, that is
         the attached transactions and the previous block pointer
+        the digest is computed once and cached since blocks never change
         """
-        # concat all the transaction identifiers
-        tx_ids: bytes = b''.join(tx.get_id() for tx in self.transactions)
-        # also, concat the previous block hash
-        block_identifier: bytes = tx_ids + self.prev_block_hash
-        # hash the block using cryptographic hash function
-        block_hash: bytes = crypto_hash(block_identifier)
-        # convert to BlockHash which is subtype of bytes
-        return BlockHash(block_hash)
+        if self._hash is None:
+            # stream all the transaction identifiers followed by the
+            # previous block hash into a single cryptographic hasher,
+            # avoiding the allocation of one big concatenated identifier
+            object.__setattr__(
+                self,
+                '_hash',
+                BlockHash(
+                    crypto_hash_parts(
+                        *(tx.get_id() for tx in self.transactions),
+                        self.prev_block_hash,
+                    )
+                ),
+            )
+        return self._hash
 
-    def get_transactions(self) -> list[Transaction]:
+    def get_transactions(self) -> tuple[Transaction, ...]:
         """
-        returns the list of transactions in this block.
+        returns the transactions in this block.
         """
         return self.transactions
 
@@ -1,4 +1,4 @@
-from custom_typing import BlockHash
+from src.custom_typing import BlockHash
 
 # every block is required to have a prev hash
 # this is the unique hash that every genesis block will have
@@ -13,6 +13,10 @@ NUM_OF_MEMPOOL_TXS_PER_BLOCK = BLOCK_SIZE - NUM_OF_COINBASE_PER_BLOCK
 SHA256_DIGEST_LEN = 256 // 8
 # cryptographic signature length in bytes
 SIGNATURE_LEN = 64
+# ed25519 public key length in bytes
+PUBLIC_KEY_LEN = 32
+# maximal amount of recently processed block hashes each node remembers
+SEEN_BLOCK_HASHES_CACHE_SIZE = 4096
 
 __all__ = [
     "GENESIS_BLOCK_PREV",
@@ -20,5 +24,7 @@ __all__ = [
     "NUM_OF_COINBASE_PER_BLOCK",
     "NUM_OF_MEMPOOL_TXS_PER_BLOCK",
     "SHA256_DIGEST_LEN",
-    "SIGNATURE_LEN"
+    "SIGNATURE_LEN",
+    "PUBLIC_KEY_LEN",
+    "SEEN_BLOCK_HASHES_CACHE_SIZE"
 ]
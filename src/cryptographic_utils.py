@@ -1,5 +1,7 @@
+from functools import lru_cache
 from hashlib import sha256
 
+from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives.serialization import (
     Encoding,
     PublicFormat,
@@ -11,15 +13,43 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PublicKey,
 )
 
-from custom_typing import PrivateKey, Signature, PublicKey
+from src.constants import PUBLIC_KEY_LEN, SIGNATURE_LEN
+from src.custom_typing import PrivateKey, Signature, PublicKey
+
+
+def load_private_key(private_key: PrivateKey) -> Ed25519PrivateKey:
+    """
+    parses the given private key bytes into a reusable signing key object
+    callers which sign repeatedly should parse once and keep the object
+    instead of paying the decode on every signature
+    """
+    return Ed25519PrivateKey.from_private_bytes(private_key)
+
+
+def sign_with_key_object(
+        message: bytes,
+        private_key_object: Ed25519PrivateKey,
+) -> Signature:
+    """signs the given message using an already-parsed private key object"""
+    return Signature(private_key_object.sign(message))
 
 
 def sign(message: bytes, private_key: PrivateKey) -> Signature:
     """signs the given message using the given private key"""
-    private_key_object = Ed25519PrivateKey.from_private_bytes(
-        private_key
+    return sign_with_key_object(
+        message=message,
+        private_key_object=load_private_key(private_key),
     )
-    return Signature(private_key_object.sign(message))
+
+
+@lru_cache(maxsize=4096)
+def _load_public_key(public_key: PublicKey) -> Ed25519PublicKey:
+    """
+    parses the given public key bytes into a key object
+    parsing re-validates the curve point which is expensive, so the parsed
+    objects are cached per address to amortize it across verifications
+    """
+    return Ed25519PublicKey.from_public_bytes(data=public_key)
 
 
 def verify(message: bytes, signature: Signature, public_key: PublicKey) -> bool:
@@ -27,14 +57,37 @@ def verify(message: bytes, signature: Signature, public_key: PublicKey) -> bool:
     verifies a signature for a given message using a public key
     returns true iff the signature matches
     """
-    candidate = Ed25519PublicKey.from_public_bytes(data=public_key)
+    # obviously malformed inputs can be rejected without entering the
+    # cryptographic backend at all
+    if len(signature) != SIGNATURE_LEN or len(public_key) != PUBLIC_KEY_LEN:
+        return False
+    candidate = _load_public_key(public_key)
     try:
         candidate.verify(signature=signature, data=message)
         return True
-    except:
+    except InvalidSignature:
         return False
 
 
+def verify_batch(
+        messages: list[bytes],
+        signatures: list[Signature],
+        public_keys: list[PublicKey],
+) -> bool:
+    """
+    verifies a batch of signatures, returns true iff every signature matches
+    its message and public key
+    the openssl backend exposes no native ed25519 batch primitive, so this
+    falls back to sequential verification with an early exit on the first
+    failure, callers still benefit from issuing a single call per batch
+    """
+    return all(
+        verify(message=message, signature=signature, public_key=public_key)
+        for message, signature, public_key
+        in zip(messages, signatures, public_keys)
+    )
+
+
 def generate_keys() -> tuple[PrivateKey, PublicKey]:
     """
     generates a private key and a and its corresponding public key
@@ -53,8 +106,46 @@ def generate_keys() -> tuple[PrivateKey, PublicKey]:
     return PrivateKey(private_key_bytes), PublicKey(public_key_bytes)
 
 
+# canonical digest object per digest value, interning the digests lets
+# dict and set operations on them short-circuit equality checks through
+# pointer comparison after a hash hit
+_digest_pool: dict[bytes, bytes] = {}
+
+
+def _intern_digest(digest: bytes) -> bytes:
+    """
+    returns the canonical bytes object holding the given digest value
+    """
+    return _digest_pool.setdefault(digest, digest)
+
+
+# canonical public key object per key value, many transactions pay the
+# same owner so sharing one bytes object per key shrinks the working set
+# and turns repeated key comparisons into pointer comparisons
+_public_key_pool: dict[bytes, bytes] = {}
+
+
+def intern_public_key(public_key: bytes) -> bytes:
+    """
+    returns the canonical bytes object holding the given public key value
+    """
+    return _public_key_pool.setdefault(public_key, public_key)
+
+
 def crypto_hash(input: bytes) -> bytes:
     """
     uses SHA256 to cryptographically hash inputs
     """
-    return sha256(input).digest()
+    return _intern_digest(sha256(input).digest())
+
+
+def crypto_hash_parts(*parts: bytes) -> bytes:
+    """
+    uses SHA256 to cryptographically hash the concatenation of the given
+    parts, the parts are streamed into a single hasher so no intermediate
+    concatenated bytes object is ever allocated
+    """
+    hasher = sha256()
+    for part in parts:
+        hasher.update(part)
+    return _intern_digest(hasher.digest())
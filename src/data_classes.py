@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from copy import deepcopy
-from block import Block
-from custom_typing import BlockHash
-from transaction import Transaction
+from src.block import Block
+from src.constants import GENESIS_BLOCK_PREV
+from src.custom_typing import BlockHash, TransactionID
+from src.transaction import Transaction
 
 
 @dataclass
@@ -14,16 +14,52 @@ class NodeState:
     """
     # committed blocks in the current state's blockchain
     blockchain: list[Block] = field(default_factory=list)
-    # unspent transaction outputs, coins which can be spent
-    utxo: list[Transaction] = field(default_factory=list)
-    # valid transactions which are waiting to be included in a block
-    mempool: list[Transaction] = field(default_factory=list)
+    # unspent transaction outputs keyed by their transaction id,
+    # coins which can be spent
+    utxo: dict[TransactionID, Transaction] = field(default_factory=dict)
+    # valid transactions which are waiting to be included in a block,
+    # keyed by their id, the dict preserves arrival order and gives O(1)
+    # membership tests at the same time
+    mempool: dict[TransactionID, Transaction] = field(default_factory=dict)
+    # index of the blockchain by block hash, kept in sync with the
+    # blockchain list to allow O(1) block retrieval and membership tests
+    hash_to_block: dict[BlockHash, Block] = field(default_factory=dict)
+    # the ordered hashes of the blockchain, starting with the genesis hash,
+    # maintained incrementally on every block append and rollback
+    hash_chain: list[BlockHash] = field(
+        default_factory=lambda: [GENESIS_BLOCK_PREV]
+    )
+    # the position of every hash within the hash chain, maintained together
+    # with it so chain offsets are resolved without a linear scan
+    hash_to_index: dict[BlockHash, int] = field(
+        default_factory=lambda: {GENESIS_BLOCK_PREV: 0}
+    )
+    # mempool transactions keyed by the input they spend, kept in sync with
+    # the mempool list to detect conflicting spends in O(1)
+    mempool_by_input: dict[TransactionID, Transaction] = field(
+        default_factory=dict
+    )
+    # the subset of the utxo whose output is owned by this node, maintained
+    # incrementally so balance queries do not scan the whole utxo
+    owned_utxo: dict[TransactionID, Transaction] = field(default_factory=dict)
 
     def copy(self) -> NodeState:
         """
-        returns a deep copy of this data-structure
+        returns an independent copy of this data-structure
+        the containers are copied shallowly, the blocks and transactions
+        themselves are immutable in practice so they can safely be shared
+        between the copies
         """
-        return deepcopy(self)
+        return NodeState(
+            blockchain=list(self.blockchain),
+            utxo=dict(self.utxo),
+            mempool=dict(self.mempool),
+            hash_to_block=dict(self.hash_to_block),
+            hash_chain=list(self.hash_chain),
+            hash_to_index=dict(self.hash_to_index),
+            mempool_by_input=dict(self.mempool_by_input),
+            owned_utxo=dict(self.owned_utxo),
+        )
 
 
 @dataclass
@@ -36,14 +72,17 @@ class ForkData:
     new_branch: list[Block] = field(default_factory=list)
     new_branch_hashes: list[BlockHash] = field(default_factory=list)
 
-    def get_potential_forked_chain_len(self, main_hash_chain: list[BlockHash]) -> int:
+    def get_potential_forked_chain_len(
+            self,
+            main_hash_to_index: dict[BlockHash, int],
+    ) -> int:
         """
         determines the potential length of the blockchain if all blocks in the new branch
         are valid and successfully appended to the current main blockchain.
         this method is employed to assess whether it's worthwhile to attempt validating
         a new branch and if it has the potential to surpass the current main blockchain.
-        notice, this function assumes main_hash_chain has the genesis hash as the
-        first block hash
+        notice, this function assumes main_hash_to_index maps the genesis hash
+        to index zero
         """
-        common_hashes_len = main_hash_chain.index(self.fork_block_hash) + 1
+        common_hashes_len = main_hash_to_index[self.fork_block_hash] + 1
         return common_hashes_len + len(self.new_branch)
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 import secrets
-from typing import Optional
-
-from constants import *
-from custom_typing import TransactionID, PublicKey, BlockHash
-from cryptographic_utils import generate_keys, sign
-from data_classes import ForkData, NodeState
-from transaction import Transaction
-from block import Block
-from validations import validate_transaction_pre_mempool_access, validate_block_structure
+from collections import OrderedDict
+from itertools import islice
+from typing import Callable, Optional
+
+from src.constants import *
+from src.custom_typing import TransactionID, PublicKey, BlockHash
+from src.cryptographic_utils import (
+    generate_keys,
+    load_private_key,
+    sign_with_key_object,
+    verify_batch,
+)
+from src.data_classes import ForkData, NodeState
+from src.transaction import Transaction
+from src.block import Block
+from src.validations import validate_transaction_pre_mempool_access, validate_block_structure
 
 
 class Node:
@@ -20,10 +27,41 @@ class Node:
         creates a new node with a public address and empty state
         """
         self._private_key, self._public_key = generate_keys()
+        # keep the parsed signing key object so every signature does not
+        # pay for re-parsing the raw private key bytes
+        self._private_key_object = load_private_key(self._private_key)
         self._state = NodeState()
         self._connections: set[Node] = set()
         # efficiency related data-structures:
         self._id_to_transaction: dict[TransactionID, Transaction] = dict()
+        # transactions whose signature was already verified successfully,
+        # block validation skips re-verifying them
+        self._validated_transaction_ids: set[TransactionID] = set()
+        # recently processed block announcements in FIFO order, duplicated
+        # gossip of the same hash is dropped without re-walking the branch
+        self._recently_seen_block_hashes: OrderedDict[BlockHash, None] = (
+            OrderedDict()
+        )
+        # per-peer record of the transactions we already forwarded to them,
+        # a transaction is broadcast to each connection at most once
+        self._transactions_known_to_peer: dict[Node, set[TransactionID]] = (
+            dict()
+        )
+        # verdict of every block this node already validated, a block's
+        # validity relative to its ancestors never changes so reorgs can
+        # skip re-validating blocks they have seen before
+        self._block_status: dict[BlockHash, bool] = dict()
+
+    def __eq__(self, other: object) -> bool:
+        """
+        nodes are identified by their public address
+        """
+        return isinstance(other, Node) and other._public_key == self._public_key
+
+    def __hash__(self) -> int:
+        # hashing the public key bytes gives nodes a stable identity in
+        # sets and dicts, e.g. the connection set of their peers
+        return hash(self._public_key)
 
     def connect(self, other: Node) -> None:
         """
@@ -36,10 +74,18 @@ class Node:
         # if the two nodes are already connected, bounce
         if other in self._connections:
             return
-        # else, do bidirectional connection between the two
+        # else, register both directions at once, no recursive handshake
+        # which re-runs the membership checks on the way back
         self._connections.add(other)
-        other.connect(other=self)
-        # notify the other node, other node will notify upon his connect
+        other._connections.add(self)
+        # start tracking which transactions each side relayed to the other
+        self._transactions_known_to_peer[other] = set()
+        other._transactions_known_to_peer[self] = set()
+        # introduce each side to the other's current chain tip
+        self.get_introduced_to_new_block(
+            block_hash=other.get_latest_hash(),
+            sender=other,
+        )
         other.get_introduced_to_new_block(
             block_hash=self.get_latest_hash(),
             sender=self,
@@ -52,9 +98,12 @@ class Node:
         # bounce if there is no connection
         if other not in self._connections:
             return
-        # else, there is a connection, disconnect both
+        # else, there is a connection, drop both directions at once
         self._connections.remove(other)
-        other.disconnect_from(other=self)
+        other._connections.discard(self)
+        # the relay bookkeeping for the dropped peer is no longer needed
+        self._transactions_known_to_peer.pop(other, None)
+        other._transactions_known_to_peer.pop(self, None)
 
     def get_address(self) -> PublicKey:
         """
@@ -73,34 +122,44 @@ class Node:
         this function returns the list of transactions that didn't
         enter any block yet.
         """
-        return self._state.mempool
+        return list(self._state.mempool.values())
+
+    def has_transaction_in_mempool(self, transaction_id: TransactionID) -> bool:
+        """
+        returns true iff a transaction with the given id is waiting in this
+        node's mempool
+        """
+        return transaction_id in self._state.mempool
 
     def get_utxo(self) -> list[Transaction]:
         """
         returns this node unspent transaction outputs
         """
-        return self._state.utxo
+        return list(self._state.utxo.values())
 
     def get_latest_hash(self) -> BlockHash:
         """
         this function returns the last block hash known to this node,
         the tip of its current chain.
         """
-        return (
-            self._state.blockchain[-1].get_hash() if self._state.blockchain
-            else GENESIS_BLOCK_PREV
-        )
+        return self._state.hash_chain[-1]
+
+    def get_chain_height(self) -> int:
+        """
+        returns the number of blocks in this node's current blockchain
+        """
+        return len(self._state.blockchain)
 
     def get_block(self, block_hash: BlockHash) -> Block:
         """
         this function returns a block object given its hash.
         if the block doesn't exist a ValueError is raised.
         """
-        for block in self._state.blockchain:
-            if block.get_hash() == block_hash:
-                return block
-        # If the block doesn't exist, a ValueError is raised.
-        raise ValueError("Block does not exist in node's blockchain")
+        try:
+            return self._state.hash_to_block[block_hash]
+        except KeyError:
+            # If the block doesn't exist, a ValueError is raised.
+            raise ValueError("Block does not exist in node's blockchain")
 
     def get_balance(self):
         """
@@ -108,7 +167,7 @@ class Node:
         the blockchain. outputs that the node owned and sent away will still be considered
         as part of the balance until the spending transaction is in a valid block
         """
-        return len(self._get_my_unspent_transactions())
+        return len(self._state.owned_utxo)
 
     def add_transaction_to_mempool(self, transaction: Transaction) -> bool:
         """
@@ -120,7 +179,9 @@ class Node:
         is_valid_transaction: bool = validate_transaction_pre_mempool_access(
             transaction=transaction,
             state=self._state,
-            id_to_transaction=self._id_to_transaction,
+            # re-broadcasts of an already verified transaction skip the
+            # expensive signature verification
+            verified_transaction_ids=self._validated_transaction_ids,
         )
         if not is_valid_transaction:
             return False
@@ -143,9 +204,18 @@ class Node:
         invalid blocks. conflicting transactions are removed from the mempool during
         this process.
         """
-        curr_hash_chain = self._get_blockchain_hashes()
         # if we know this block no need to do anything
-        if block_hash in curr_hash_chain:
+        if self._is_known_block_hash(block_hash):
+            return
+        # an announcement we already processed ends the same way: block
+        # verdicts ignore the local mempool so they are fixed by the chain,
+        # and our own chain height never shrinks, so a branch which lost
+        # once can not win later, drop the duplicated gossip
+        if block_hash in self._recently_seen_block_hashes:
+            return
+        # a branch coming from a chain which is not higher than ours can
+        # never win, bail out before walking it block by block
+        if sender.get_chain_height() <= self.get_chain_height():
             return
         # else, we need to find the forking point, it can be the tip of the
         # current chain or in the middle of it
@@ -156,12 +226,17 @@ class Node:
             )
         except ValueError:
             return
+        # the branch was fully fetched, the verdict below depends only on
+        # the branch contents and our chain height, neither of which can
+        # move in the branch's favor, so the same announcement never needs
+        # to be processed again
+        self._mark_block_hash_as_seen(block_hash)
         # check if this new branch has the potential to beat the current
         # main chain given the new branch is valid
         potential_new_chain_len = fork_data.get_potential_forked_chain_len(
-            main_hash_chain=curr_hash_chain
+            main_hash_to_index=self._state.hash_to_index
         )
-        if potential_new_chain_len <= len(curr_hash_chain):
+        if potential_new_chain_len <= len(self._state.hash_chain):
             return
         # now validate the new branch and get the updated state
         new_state = self._reorg_blockchain(fork_data)
@@ -177,12 +252,24 @@ class Node:
         and one additional coinbase(s), notifying all connections upon creation,
         and returning the new block hash
         """
-        # create new coinbase txs which will be included as a fee to the miner
+        # create new coinbase txs which will be included as a fee to the
+        # miner, drawing the random filler bytes for all of them with a
+        # single call to the system csprng
+        random_bits = secrets.token_bytes(
+            SIGNATURE_LEN * NUM_OF_COINBASE_PER_BLOCK
+        )
         coinbase_transactions = [
-            self._create_coinbase() for _ in range(NUM_OF_COINBASE_PER_BLOCK)
+            self._create_coinbase(
+                signature=random_bits[
+                    index * SIGNATURE_LEN:(index + 1) * SIGNATURE_LEN
+                ]
+            )
+            for index in range(NUM_OF_COINBASE_PER_BLOCK)
         ]
-        # include non coinbase transactions from the mempool
-        mempool_transactions = self._state.mempool[:NUM_OF_MEMPOOL_TXS_PER_BLOCK]
+        # include the oldest non coinbase transactions from the mempool
+        mempool_transactions = list(
+            islice(self._state.mempool.values(), NUM_OF_MEMPOOL_TXS_PER_BLOCK)
+        )
         new_block = Block(
             prev_block_hash=self.get_latest_hash(),
             transactions=coinbase_transactions + mempool_transactions
@@ -213,17 +300,29 @@ class Node:
         clears the mempool of this node, all transactions waiting to be entered
         into the next block are gone.
         """
-        self._state.mempool = []
+        dropped_transaction_ids = set(self._state.mempool)
+        self._state.mempool = dict()
+        self._state.mempool_by_input = dict()
+        # peers which relayed the dropped transactions must be free to
+        # relay them again, erase their record of having offered them to us
+        for node in self._connections:
+            known_to_us = node._transactions_known_to_peer.get(self)
+            if known_to_us is not None:
+                known_to_us.difference_update(dropped_transaction_ids)
 
     def _add_new_transaction_to_mempool(self, transaction: Transaction) -> None:
         """
         updates internal state upon new transaction arrival in the mempool, notifies
         the other connections
         """
-        # add it to the mempool list
-        self._state.mempool.append(transaction)
+        # add it to the mempool and its spent-input index
+        self._state.mempool[transaction.get_id()] = transaction
+        self._state.mempool_by_input[transaction.input] = transaction
         # map it to its id for efficient retrieval
         self._id_to_transaction[transaction.get_id()] = transaction
+        # its signature was verified upon mempool admission, remember that
+        # so block validation does not pay for the verification again
+        self._validated_transaction_ids.add(transaction.get_id())
         # notify the others
         self._publish_new_transaction(transaction=transaction)
 
@@ -232,17 +331,54 @@ class Node:
         notify other node connections of new mempool transactions, idempotent.
         """
         transaction_id = transaction.get_id()
-        for node in self._connections:
-            connection_known_txs = [tx.get_id() for tx in node.get_mempool()]
-            if transaction_id not in connection_known_txs:
-                node.add_transaction_to_mempool(transaction=transaction)
+        # snapshot the connections, the notified nodes may mutate the set
+        # while the broadcast recurses through the network
+        for node in tuple(self._connections):
+            known_to_peer = self._transactions_known_to_peer.get(node)
+            if known_to_peer is None or transaction_id in known_to_peer:
+                # the peer disconnected mid-broadcast or already holds
+                # this transaction, nothing to relay
+                continue
+            if (
+                    node.has_transaction_in_mempool(transaction_id)
+                    or node.add_transaction_to_mempool(transaction=transaction)
+            ):
+                # only transactions the peer actually holds are recorded,
+                # a peer which rejected the offer, or later drops the
+                # transaction, may be offered it again
+                known_to_peer.add(transaction_id)
+
+    @staticmethod
+    def _remove_from_mempool(
+            state: NodeState,
+            should_remove: Callable[[Transaction], bool],
+    ) -> None:
+        """
+        removes every mempool transaction matching the given predicate,
+        keeping the spent-input index in sync
+        """
+        removed = [t for t in state.mempool.values() if should_remove(t)]
+        for transaction in removed:
+            del state.mempool[transaction.get_id()]
+            state.mempool_by_input.pop(transaction.input, None)
 
-    def _get_blockchain_hashes(self) -> list[BlockHash]:
+    def _mark_block_hash_as_seen(self, block_hash: BlockHash) -> None:
         """
-        returns the ordered list of the current state's blockchain hashes
+        remembers that the given block announcement was already processed,
+        the memory is bounded, oldest entries are evicted first
         """
-        block_hashes = [b.get_hash() for b in self._state.blockchain]
-        return [GENESIS_BLOCK_PREV] + block_hashes
+        self._recently_seen_block_hashes[block_hash] = None
+        if len(self._recently_seen_block_hashes) > SEEN_BLOCK_HASHES_CACHE_SIZE:
+            self._recently_seen_block_hashes.popitem(last=False)
+
+    def _is_known_block_hash(self, block_hash: BlockHash) -> bool:
+        """
+        returns true iff the given hash belongs to this node's blockchain
+        """
+        return (
+                block_hash == GENESIS_BLOCK_PREV
+                or block_hash in self._state.hash_to_block
+        )
 
     def _find_forking_point(
             self,
@@ -256,13 +392,15 @@ class Node:
         new_branch, new_branch_hashes = [], []
         # iterate until we find the forking point
         running_hash = block_hash
-        while running_hash not in self._get_blockchain_hashes():
+        while not self._is_known_block_hash(running_hash):
             running_block = sender.get_block(running_hash)
-            # add the new branch and its hash to the start of the list
-            # so at the end we will have the branch sorted
-            new_branch = [running_block] + new_branch
-            new_branch_hashes = [running_hash] + new_branch_hashes
+            new_branch.append(running_block)
+            new_branch_hashes.append(running_hash)
             running_hash = running_block.get_prev_block_hash()
+        # the branch was collected tip first, reverse once so it is sorted
+        # from the forking point towards the tip
+        new_branch.reverse()
+        new_branch_hashes.reverse()
 
         return ForkData(
             fork_block_hash=running_hash,
@@ -300,23 +438,36 @@ class Node:
         """
         latest_block = state.blockchain.pop()
         block_transactions = latest_block.get_transactions()
-        block_transaction_ids = [t.get_id() for t in block_transactions]
+        # a set, so the membership tests below are O(1) per transaction
+        block_transaction_ids = {t.get_id() for t in block_transactions}
         # remember every transaction can be seen as a coin, or as a transaction
         # output that the receiver can spend. but if we revert this block
         # we need to deny the given coin to every receiver who gained the coin
         # via this block
 
-        state.utxo = [t for t in state.utxo if t not in block_transactions]
-        # now, let's add back the inputs that were spent in this block
-        # excluding coinbase transactions
-        curr_block_spent_transactions = [
-            self._id_to_transaction[t.input] for t in block_transactions
-            if not t.is_coinbase
+        for transaction_id in block_transaction_ids:
+            state.utxo.pop(transaction_id, None)
+            state.owned_utxo.pop(transaction_id, None)
+        # now, let's add back the inputs that were spent in this block,
+        # coinbase transactions spent nothing so they are skipped upfront
+        non_coinbase_transactions = [
+            t for t in block_transactions if not t.is_coinbase
         ]
-        state.utxo += curr_block_spent_transactions
+        for transaction in non_coinbase_transactions:
+            spent_transaction = self._id_to_transaction[transaction.input]
+            state.utxo[transaction.input] = spent_transaction
+            if spent_transaction.output == self._public_key:
+                state.owned_utxo[transaction.input] = spent_transaction
         # additionally, we need to remove transactions in the mempool
         # which try to spend coins which were introduced in the latest block
-        state.mempool = [t for t in state.mempool if t.input not in block_transaction_ids]
+        self._remove_from_mempool(
+            state=state,
+            should_remove=lambda t: t.input in block_transaction_ids,
+        )
+        # the reverted block is no longer part of the chain, un-index it
+        state.hash_to_block.pop(latest_block.get_hash(), None)
+        state.hash_to_index.pop(latest_block.get_hash(), None)
+        state.hash_chain.pop()
         return latest_block
 
     def _rollback_state_to_forking_point(
@@ -362,33 +513,112 @@ class Node:
     ) -> bool:
         """
         In charge of validating a block and update the given state
+        block validation ignores the local mempool, so a block's verdict
+        only depends on itself and its ancestors and is cached per hash,
+        re-used by later reorg attempts, known-valid blocks are applied to
+        the state without re-validation
+        """
+        known_status = self._block_status.get(block_hash)
+        if known_status is False:
+            return False
+        if known_status is None:
+            is_valid_block = self._validate_block(
+                block=block,
+                block_hash=block_hash,
+                state=state,
+            )
+            self._block_status[block_hash] = is_valid_block
+            if not is_valid_block:
+                return False
+        # if all the transaction are valid, we can update the state accordingly
+        for transaction in block.get_transactions():
+            self._introduce_valid_transaction_into_state(
+                transaction=transaction,
+                state=state
+            )
+        # finally, we extend the blockchain, by one, and index the new block
+        state.blockchain.append(block)
+        state.hash_to_block[block_hash] = block
+        state.hash_to_index[block_hash] = len(state.hash_chain)
+        state.hash_chain.append(block_hash)
+        return True
+
+    def _validate_block(
+            self,
+            block: Block,
+            block_hash: BlockHash,
+            state: NodeState,
+    ) -> bool:
+        """
+        returns true iff the given block and its attached transactions
+        are valid relative to the given state
         """
-        # not, this also checks the number of coinbase transactions
+        # note, this also checks the number of coinbase transactions
         has_valid_structure = validate_block_structure(
             block=block,
             block_hash=block_hash
         )
         if not has_valid_structure:
             return False
+        non_coinbase_transactions = [
+            t for t in block.get_transactions() if not t.is_coinbase
+        ]
+        # verify all the block signatures in a single batched call, the
+        # per-transaction validations below can then skip the expensive
+        # signature verification
+        if not self._batch_verify_transactions(non_coinbase_transactions):
+            return False
         # now validate the block non-coinbase transactions
-        has_valid_transactions = all(
+        return all(
             validate_transaction_pre_mempool_access(
                 transaction=transaction,
                 state=state,
-                id_to_transaction=self._id_to_transaction
+                check_signature=False,
+                # a collision with the local mempool does not invalidate a
+                # block, applying it evicts the conflicting mempool entries,
+                # skipping the check keeps the verdict ancestor-only so it
+                # can be safely cached per block hash
+                check_mempool_conflict=False,
             )
-            for transaction in block.get_transactions() if not transaction.is_coinbase
+            for transaction in non_coinbase_transactions
         )
-        if not has_valid_transactions:
-            return False
-        # if all the transaction are valid, we can update the state accordingly
-        for transaction in block.get_transactions():
-            self._introduce_valid_transaction_into_state(
-                transaction=transaction,
-                state=state
-            )
-        # finally, we extend the blockchain, by one
-        state.blockchain = state.blockchain + [block]
+
+    def _batch_verify_transactions(self, transactions: list[Transaction]) -> bool:
+        """
+        verifies the signatures of the given non-coinbase transactions
+        using a single batched call
+        transactions whose spent input can not be resolved are skipped here,
+        the per-transaction validation rejects them anyway
+        """
+        messages, signatures, public_keys = [], [], []
+        batched_transaction_ids: list[TransactionID] = []
+        for transaction in transactions:
+            if not isinstance(transaction.input, bytes):
+                continue
+            # skip transactions which already passed verification, e.g.
+            # when they were admitted into the mempool
+            if transaction.get_id() in self._validated_transaction_ids:
+                continue
+            input_being_spent = self._id_to_transaction.get(transaction.input)
+            if input_being_spent is None:
+                continue
+            # the transaction ID being spent concatenated with the target
+            # is the signed message
+            messages.append(transaction.get_signed_message())
+            signatures.append(transaction.signature)
+            # the owner of the coin being spent is the expected signer
+            public_keys.append(input_being_spent.output)
+            batched_transaction_ids.append(transaction.get_id())
+        is_valid_batch = verify_batch(
+            messages=messages,
+            signatures=signatures,
+            public_keys=public_keys,
+        )
+        if is_valid_batch:
+            # remember the verified transactions so a future re-validation,
+            # e.g. during another reorg attempt, skips them
+            self._validated_transaction_ids.update(batched_transaction_ids)
+        return is_valid_batch
 
     def _introduce_valid_transaction_into_state(
             self,
@@ -399,19 +629,29 @@ class Node:
         Updates state internals upon new valid transaction which is on the blockchain
         """
         transaction_id = transaction.get_id()
+        if transaction.is_coinbase:
+            # coinbase transactions spend nothing and can not conflict with
+            # the mempool, they only mint a new spendable output
+            state.utxo[transaction_id] = transaction
+            if transaction.output == self._public_key:
+                state.owned_utxo[transaction_id] = transaction
+            self._id_to_transaction[transaction_id] = transaction
+            return
         # Once a transaction entered the blockchain, it can be removed from the mempool
         # also, any other transaction which tries to spend this transaction
         # input is invalid, so let's remove it
-        state.mempool = [
-            t for t in state.mempool
-            if t != transaction and t.input != transaction.input
-        ]
-        # every valid transaction spends an input unless it is a coinbase tx
+        self._remove_from_mempool(
+            state=state,
+            should_remove=lambda t: t == transaction or t.input == transaction.input,
+        )
+        # every valid non-coinbase transaction spends an input
         # lets remove this input from the utxo
-        if not transaction.is_coinbase:
-            state.utxo = [t for t in state.utxo if t.get_id() != transaction.input]
+        state.utxo.pop(transaction.input, None)
+        state.owned_utxo.pop(transaction.input, None)
         # every valid transaction introduces new inputs which can be spent
-        state.utxo.append(transaction)
+        state.utxo[transaction_id] = transaction
+        if transaction.output == self._public_key:
+            state.owned_utxo[transaction_id] = transaction
         # lastly, extend the id to tx mapping
         self._id_to_transaction[transaction_id] = transaction
 
@@ -419,7 +659,9 @@ class Node:
         """
         informs all other connections that a new block has been introduced
         """
-        for node in self._connections:
+        # snapshot the connections, the notified nodes may mutate the set
+        # while the broadcast recurses through the network
+        for node in tuple(self._connections):
             node.get_introduced_to_new_block(
                 block_hash=self.get_latest_hash(),
                 sender=self
@@ -429,21 +671,22 @@ class Node:
         """
         returns a subset of this node's utxo, the outputs owned by this node
         """
-        return [t for t in self._state.utxo if t.output == self.get_address()]
+        return list(self._state.owned_utxo.values())
 
-    def _create_coinbase(self) -> Transaction:
+    def _create_coinbase(self, signature: bytes) -> Transaction:
         """
         creates a coinbase transaction which grants money to this node,
         which potentially mined a block
+        the caller provides the random bytes filling the signature field so
+        a whole block's worth can be drawn in one csprng call
         """
-        random_bits = secrets.token_bytes(SIGNATURE_LEN)
         coinbase = Transaction(
             # this node will get this coin
             output=self._public_key,
             # coinbase transaction have no previous coin which they spend
             input=None,
             # fill in random bytes instead of signature
-            signature=random_bits,
+            signature=signature,
         )
         return coinbase
 
@@ -458,8 +701,11 @@ class Node:
                 transaction=transaction,
                 state=state
             )
-        # append the new block to the blockchain and publish it
+        # append the new block to the blockchain, index it and publish it
         state.blockchain.append(block)
+        state.hash_to_block[block.get_hash()] = block
+        state.hash_to_index[block.get_hash()] = len(state.hash_chain)
+        state.hash_chain.append(block.get_hash())
         self._publish_latest_block()
 
     def _sign_new_transaction(
@@ -470,11 +716,11 @@ class Node:
         """
         signs a new transaction to target which spends the given unspent coin
         """
-        signature = sign(
+        signature = sign_with_key_object(
             # which output is being spent and who is the legal holder now
             message=unspent_transaction_id + target_public_key,
             # signed by the spender
-            private_key=self._private_key
+            private_key_object=self._private_key_object
         )
         transaction = Transaction(
             # the target which get the funds
@@ -490,13 +736,9 @@ class Node:
         """
         gets an available unspent transaction of this node
         """
-        owned_funds = self._get_my_unspent_transactions()
-        owned_funds_ids = [t.get_id() for t in owned_funds]
-        # frozen funds are inputs which are in the mempool, but not a block
-        # gather all the owned funds which are already promised to other node
-        frozen_funds = [
-            self._id_to_transaction[t.input] for t in self._state.mempool
-            if t.input in owned_funds_ids
-        ]
-        available_funds = set(owned_funds).difference(frozen_funds)
-        return available_funds.pop() if available_funds else None
+        # frozen funds are inputs which are in the mempool, but not a block,
+        # those coins are already promised to another node so skip them
+        for transaction_id, transaction in self._state.owned_utxo.items():
+            if transaction_id not in self._state.mempool_by_input:
+                return transaction
+        return None
@@ -1,46 +1,84 @@
+from dataclasses import dataclass, field
 from typing import Optional
 
-from src.cryptographic_utils import crypto_hash
+from src.cryptographic_utils import crypto_hash_parts, intern_public_key
 from src.custom_typing import PublicKey, TransactionID, Signature
 
 
+@dataclass(frozen=True, slots=True)
 class Transaction:
     """
     represents a transaction that moves a single coin
     a coin base transaction is a transaction which has no source / input
     and basically creates money
+    transactions are immutable, their content is fixed at construction time
     """
+    # the node which receives the coin
+    output: PublicKey
+    # the transaction being spent (can be None for coinbase txs)
+    input: Optional[TransactionID]
+    # signature created with a private key of the payer
+    # the message is the payee and the coin being spent (output + input)
+    # other nodes will verify that indeed the payer signed the tx
+    signature: Signature
+    # lazily computed and memoized identifier of this transaction
+    _id: Optional[TransactionID] = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    # lazily computed and memoized message covered by the signature
+    _signed_message: Optional[bytes] = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
-    def __init__(
-            self,
-            output: PublicKey,
-            input: Optional[TransactionID],
-            signature: Signature
-    ) -> None:
-        # the node which receives the coin
-        self.output: PublicKey = output
-        # the transaction being spent (can be None for coinbase txs)
-        self.input: Optional[TransactionID] = input
-        # signature created with a private key of the payer
-        # the message is the payee and the coin being spent (output + input)
-        # other nodes will verify that indeed the payer signed the tx
-        self.signature: Signature = signature
+    def __post_init__(self) -> None:
+        # many transactions pay the same owner, share one bytes object per
+        # distinct public key instead of holding duplicated copies
+        object.__setattr__(self, 'output', intern_public_key(self.output))
 
     def get_id(self) -> TransactionID:
         """
         returns the identifier of this transaction.
         that is the sha256 digest of the transaction contents
+        the digest is computed once and cached since transactions never change
         """
-        # concat all the fields which identify a single transaction
-        tx_identifier: bytes = (
-                self.output
-                + (self.input or b'')  # input can be None
-                + self.signature
-        )
-        # hash the identifier using sha256
-        tx_hash: bytes = crypto_hash(tx_identifier)
-        # convert to TransactionID which is subtype of bytes
-        return TransactionID(tx_hash)
+        if self._id is None:
+            # stream the fields which identify a single transaction into a
+            # single sha256 hasher, the input is skipped for coinbase
+            # transactions, no intermediate concatenation is allocated
+            identifying_parts = (
+                (self.output, self.signature)
+                if self.input is None
+                else (self.output, self.input, self.signature)
+            )
+            # convert to TransactionID which is subtype of bytes
+            object.__setattr__(
+                self,
+                '_id',
+                TransactionID(crypto_hash_parts(*identifying_parts)),
+            )
+        return self._id
+
+    def get_signed_message(self) -> bytes:
+        """
+        returns the message the payer signed, which coin is being spent and
+        who is the legal holder now (input + output)
+        only meaningful for non-coinbase transactions which spend an input
+        the concatenation is computed once and cached since transactions
+        never change
+        """
+        if self._signed_message is None:
+            object.__setattr__(
+                self,
+                '_signed_message',
+                self.input + self.output,
+            )
+        return self._signed_message
 
     @property
     def is_coinbase(self) -> bool:
@@ -1,57 +1,73 @@
+from typing import Optional
+
 from src.block import Block
 from src.constants import *
 from src.cryptographic_utils import verify
 from src.custom_typing import TransactionID, BlockHash
 from src.data_classes import NodeState
-from transaction import Transaction
+from src.transaction import Transaction
 
 
 def validate_transaction_pre_mempool_access(
         transaction: Transaction,
         state: NodeState,
-        id_to_transaction: dict[TransactionID, Transaction],
+        check_signature: bool = True,
+        check_mempool_conflict: bool = True,
+        verified_transaction_ids: Optional[set[TransactionID]] = None,
 ) -> bool:
     """
     checks whether the specified coin in the transaction
     input indeed belongs to the payer and makes sure it is unspent
     makes sure there is no contradicting transaction which tires to spend the
     same input in the given mempool
+    check_signature can be disabled by callers which already verified the
+    signature, e.g. as part of a batched block verification
+    check_mempool_conflict can be disabled by block validation: a block
+    transaction colliding with the local mempool is not invalid, applying
+    the block evicts the conflicting mempool entries, and skipping the
+    check keeps block verdicts a function of the chain alone
+    verified_transaction_ids, when given, is consulted to skip verifying
+    transactions whose signature already passed and is updated on success
+    the checks are ordered from the cheapest to the most expensive so the
+    elliptic-curve signature verification only runs on otherwise valid
+    transactions
     """
-    # make sure it passes the sanity test of every input
-    is_valid_type = (
-            type(transaction.input) == bytes
-            and len(transaction.input) == SHA256_DIGEST_LEN
-    )
-    if not is_valid_type:
+    # make sure it passes the sanity test of every input, note that
+    # isinstance also accepts bytes subtypes such as TransactionID
+    spent_input = transaction.input
+    if not isinstance(spent_input, bytes) or len(spent_input) != SHA256_DIGEST_LEN:
         return False
-    # the input field of each transaction specifies which
-    # transaction is being spent, let's get it
-    input_being_spent: Transaction = id_to_transaction.get(transaction.input)
-    # if there is not such transaction, invalid coin is being spent
+    # the input field of each transaction specifies which transaction is
+    # being spent, it must be an unspent output in the given utxo set
+    input_being_spent: Transaction = state.utxo.get(spent_input)
+    # if there is no such coin, an invalid or spent coin is being spent
     if input_being_spent is None:
         return False
-    # we also need to verify that the payer is the one who singed the tx
+    # make sure there is no other transaction which tires to spend
+    # this coin in the mempool
+    if check_mempool_conflict and transaction.input in state.mempool_by_input:
+        return False
+    already_verified = (
+            verified_transaction_ids is not None
+            and transaction.get_id() in verified_transaction_ids
+    )
+    if not check_signature or already_verified:
+        return True
+    # lastly, we verify that the payer is the one who singed the tx
     input_owner_public_key = input_being_spent.output
     does_signature_match: bool = verify(
         # the transaction ID being spent concatenated with the target is the message
-        message=transaction.input + transaction.output,
+        message=transaction.get_signed_message(),
         # the signature should match the payer's PK
         signature=transaction.signature,
         # coin_being_spent.output is the owner of the coin being spent
         # since he is the one who got the coin
         public_key=input_owner_public_key
-
     )
-    # if it failed tries to spend money he does not own
-    if not does_signature_match:
-        return False
-    # we check that the input is unspent in the given utxo set
-    input_is_unspent = transaction.input in [t.get_id() for t in state.utxo]
-    if not input_is_unspent:
-        return False
-    # finally, we make sure there is no other transaction which tires
-    # to spend this coin in the mempool
-    return transaction.input not in [tx.input for tx in state.mempool]
+    # remember the successful verification for future re-validations
+    if does_signature_match and verified_transaction_ids is not None:
+        verified_transaction_ids.add(transaction.get_id())
+    return does_signature_match
 
 
 def validate_block_structure(
@@ -63,15 +79,14 @@ def validate_block_structure(
     transaction
     """
     transactions = block.get_transactions()
-    coinbase_txs = [t for t in transactions if t.is_coinbase]
-
-    return all(
-        [
-            # validate the calculated hash matches the one requested
-            block.get_hash() == block_hash,
+    number_of_coinbase_txs = sum(1 for t in transactions if t.is_coinbase)
+    # ordered from the cheapest check to the most expensive one, the boolean
+    # and short-circuits so malformed blocks skip the hash computation
+    return (
             # validate the size of a block
-            len(transactions) <= BLOCK_SIZE,
+            len(transactions) <= BLOCK_SIZE
             # validate number of coinbase transactions
-            len(coinbase_txs) == NUM_OF_COINBASE_PER_BLOCK
-        ]
+            and number_of_coinbase_txs == NUM_OF_COINBASE_PER_BLOCK
+            # validate the calculated hash matches the one requested
+            and block.get_hash() == block_hash
     )
@@ -75,6 +75,66 @@ def test_moving_funds_and_balances(alice: Node, bob: Node) -> None:
     assert bob.get_balance() == NUM_OF_COINBASE_PER_BLOCK + 1
 
 
+def test_longer_chain_adoption_on_connect(alice: Node, bob: Node) -> None:
+    for _ in range(3):
+        alice_hash = alice.mine_block()
+    bob.mine_block()
+    bob.connect(alice)
+    assert bob.get_latest_hash() == alice_hash
+    assert alice.get_latest_hash() == alice_hash
+    assert alice.get_balance() == 3 * NUM_OF_COINBASE_PER_BLOCK
+    assert bob.get_balance() == 0
+
+
+def test_block_containing_mempool_transaction_is_adopted(alice: Node, bob: Node) -> None:
+    alice.mine_block()
+    bob.connect(alice)
+    transaction = alice.create_transaction(bob.get_address())
+    # the transaction was relayed, bob holds it in his own mempool
+    assert transaction in bob.get_mempool()
+    # the block containing it must still be adopted by bob, the mempool
+    # copy is evicted rather than treated as a conflicting spend
+    block_hash = alice.mine_block()
+    assert bob.get_latest_hash() == block_hash
+    assert bob.get_mempool() == []
+    assert bob.get_balance() == 1
+    # and bob keeps syncing as mining continues
+    for _ in range(2):
+        block_hash = alice.mine_block()
+    assert bob.get_latest_hash() == block_hash
+
+
+def test_resync_after_disconnect_and_mempool_clear(alice: Node, bob: Node) -> None:
+    alice.mine_block()
+    bob.connect(alice)
+    alice.create_transaction(bob.get_address())
+    bob.disconnect_from(alice)
+    bob.clear_mempool()
+    # alice advances while bob is away, reconnecting must catch bob up
+    block_hash = alice.mine_block()
+    bob.connect(alice)
+    assert bob.get_latest_hash() == block_hash
+    # a duplicated announcement of the same tip is a harmless no-op
+    bob.get_introduced_to_new_block(block_hash=block_hash, sender=alice)
+    assert bob.get_latest_hash() == block_hash
+    # and later blocks keep flowing
+    next_hash = alice.mine_block()
+    assert bob.get_latest_hash() == next_hash
+
+
+def test_transaction_rerelayed_after_mempool_clear(alice: Node, bob: Node) -> None:
+    alice.mine_block()
+    bob.connect(alice)
+    transaction = alice.create_transaction(bob.get_address())
+    assert transaction in bob.get_mempool()
+    alice.clear_mempool()
+    bob.clear_mempool()
+    # the coin is still unspent, re-adding the same transaction must
+    # propagate to bob again even though it was relayed to him before
+    assert alice.add_transaction_to_mempool(transaction)
+    assert transaction in bob.get_mempool()
+
+
 def test_self_connections_fail(alice: Node) -> None:
     with pytest.raises(Exception):
         alice.connect(alice)